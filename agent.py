@@ -4,17 +4,128 @@ OpenAI agent using structured tool calling with a Pydantic-derived JSON schema.
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
-
+import json
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Mapping
+
+import openai
 from loguru import logger
 from openai import OpenAI
-
-from config.configuration import TOOL_NAME
-from config.parameters import MODEL, TEMPERATURE
-from config.prompts import SYSTEM_PROMPT
+from openai.types.responses import Response
+from tenacity import (
+    RetryCallState,
+    retry,
+    retry_if_exception_type,
+    stop_after_attempt,
+    wait_exponential,
+)
+
+from config.configuration import STATS_TOOL_NAME, TOOL_NAME
+from config.parameters import (
+    BATCH_COMPLETION_WINDOW,
+    BATCH_POLL_INITIAL_S,
+    BATCH_POLL_MAX_S,
+    MODEL,
+    OPENAI_MAX_ATTEMPTS,
+    OPENAI_RETRY_MAX_S,
+    OPENAI_RETRY_MIN_S,
+    TEMPERATURE,
+    USE_BATCH_API,
+)
+from config.prompts import (
+    MISSING_CALLS_INSTRUCTION,
+    MULTI_MATCH_INSTRUCTION,
+    SYSTEM_PROMPT,
+)
 from schemas import MatchReport
 
+_BATCH_ENDPOINT = "/v1/responses"
+_BATCH_TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+_MATCH_INDEX_FIELD = "match_index"
+_REPORT_FIELD = "report"
+_RETRYABLE_ERRORS = (
+    openai.RateLimitError,
+    openai.APITimeoutError,
+    openai.APIConnectionError,
+    openai.InternalServerError,
+)
+
+
+def _log_retry(retry_state: RetryCallState) -> None:
+    exc = retry_state.outcome.exception() if retry_state.outcome else None
+    logger.warning(
+        "OpenAI call failed (attempt {}/{}): {!r}; retrying",
+        retry_state.attempt_number,
+        OPENAI_MAX_ATTEMPTS,
+        exc,
+    )
+
+
+def _build_tools(
+    raw_schema: dict[str, Any], indexed: bool = False
+) -> list[dict[str, Any]]:
+    """
+    Build the stats and report tool definitions from the MatchReport JSON schema.
+
+    Statistics and the narrative are separate tools so the model can emit both
+    calls in one turn (parallel tool calls); their arguments are merged back into
+    one MatchReport. With indexed=True each tool also requires a match_index.
+    """
+    properties: dict[str, Any] = raw_schema["properties"]
+    required: list[str] = raw_schema["required"]
+
+    stats_properties = {k: v for k, v in properties.items() if k != _REPORT_FIELD}
+    stats_required = [k for k in required if k != _REPORT_FIELD]
+    report_properties = {_REPORT_FIELD: properties[_REPORT_FIELD]}
+    report_required = [_REPORT_FIELD]
+
+    if indexed:
+        index_property = {
+            _MATCH_INDEX_FIELD: {
+                "type": "integer",
+                "description": "1-based number of the match this call reports on.",
+            }
+        }
+        stats_properties = {**index_property, **stats_properties}
+        stats_required = [_MATCH_INDEX_FIELD, *stats_required]
+        report_properties = {**index_property, **report_properties}
+        report_required = [_MATCH_INDEX_FIELD, *report_required]
+
+    return [
+        {
+            "type": "function",
+            "name": STATS_TOOL_NAME,
+            "description": "Submit extracted match statistics and timeline events.",
+            "parameters": {
+                "type": "object",
+                "properties": stats_properties,
+                "required": stats_required,
+                # Event models and enums are referenced as #/$defs/...
+                "$defs": raw_schema.get("$defs", {}),
+            },
+        },
+        {
+            "type": "function",
+            "name": TOOL_NAME,
+            "description": "Submit a 300-word match report.",
+            "parameters": {
+                "type": "object",
+                "properties": report_properties,
+                "required": report_required,
+            },
+        },
+    ]
+
+
+# Tool definitions are invariant, so the MatchReport schema is generated once at import
+_RAW_SCHEMA: dict[str, Any] = MatchReport.model_json_schema()
+_TOOLS: list[dict[str, Any]] = _build_tools(_RAW_SCHEMA)
+# Same tools plus a match_index field, for several matches in one request
+_INDEXED_TOOLS: list[dict[str, Any]] = _build_tools(_RAW_SCHEMA, indexed=True)
+
 
 @dataclass(frozen=True)
 class MatchReportAgent:
@@ -24,6 +135,10 @@ class MatchReportAgent:
 
     api_key: str | None
     model: str = MODEL
+    use_batch_api: bool = USE_BATCH_API
+    _client: OpenAI = field(init=False, repr=False, compare=False)
+    _single_attempt_client: OpenAI = field(init=False, repr=False, compare=False)
+    _instructions: Mapping[str, str] = field(init=False, repr=False, compare=False)
 
     def __post_init__(self) -> None:
         logger.debug("Initializing MatchReportAgent")
@@ -35,21 +150,53 @@ class MatchReportAgent:
 
         logger.debug("API key validation passed")
 
+        # --- OpenAI client (reused across calls to keep connections alive) ---
+        logger.debug("Creating OpenAI client")
+        client = OpenAI(api_key=self.api_key)
+        object.__setattr__(self, "_client", client)
+        # Same connection pool without SDK retries, for calls wrapped by _call_openai's
+        # own retry policy (OPENAI_MAX_ATTEMPTS), so the two do not multiply
+        object.__setattr__(
+            self, "_single_attempt_client", client.with_options(max_retries=0)
+        )
+
+        # --- Instructions per supported report language (shared by all agents) ---
+        object.__setattr__(self, "_instructions", _build_instructions())
+
         # --- Configuration summary ---
         logger.info("MatchReportAgent configuration")
-        logger.info(f"Model: {self.model}")
+        logger.info("Model: {}", self.model)
+        logger.info("Batch API: {}", "enabled" if self.use_batch_api else "disabled")
 
         # --- Success ---
         logger.success("MatchReportAgent initialized successfully")
 
-    def _language_instruction(self, language: str) -> str:
-        if language == "cs":
-            return "Generate the report in Czech language."
-        return "Generate the report in English language."
+    def _request_params(self, cleaned_text: str, language: str) -> dict[str, Any]:
+        """
+        Build the Responses API request parameters for a single report.
+        """
+        return {
+            "model": self.model,
+            "input": cleaned_text,
+            "temperature": TEMPERATURE,
+            "instructions": self._instructions.get(language, self._instructions["en"]),
+            "tool_choice": "required",
+            "parallel_tool_calls": True,
+            "tools": _TOOLS,
+        }
 
-    def analyze(self, cleaned_text: str, language: str = "en") -> MatchReport:
+    def analyze(
+        self,
+        cleaned_text: str,
+        language: str = "en",
+        on_delta: Callable[[str], None] | None = None,
+    ) -> MatchReport:
         """
         Analyze cleaned page text and return a validated MatchReport.
+
+        If on_delta is given, the response is streamed and on_delta is called with
+        the tool-call arguments accumulated so far, so callers can show progress
+        while the model is still generating.
         """
         logger.info("Starting analysis with OpenAI agent")
 
@@ -57,107 +204,457 @@ class MatchReportAgent:
             logger.error("cleaned_text is empty")
             raise ValueError("cleaned_text is empty.")
 
-        logger.debug(f"Input text length: {len(cleaned_text)} characters")
+        logger.debug("Input text length: {} characters", len(cleaned_text))
 
-        # --- OpenAI client ---
-        logger.debug("Creating OpenAI client")
-        client = OpenAI(api_key=self.api_key)
+        # --- OpenAI call ---
+        logger.info(
+            "Sending request to OpenAI (tool_choice=required, parallel tool calls)"
+        )
+        try:
+            params = self._request_params(cleaned_text, language)
+            resp = self._call_openai(params, on_delta)
 
-        # --- Tool schema ---
-        logger.debug("Generating JSON schema from MatchReport")
-        raw_schema = MatchReport.model_json_schema()
+        except Exception:
+            logger.exception("OpenAI API call failed")
+            raise
 
-        logger.debug(f"Tool name: {TOOL_NAME}")
-        logger.debug(f"Tool schema keys: {list(raw_schema.keys())}")
+        logger.success("OpenAI response received")
 
-        tool_schema = {
-            "type": "object",
-            "properties": raw_schema["properties"],
-            "required": raw_schema["required"],
-        }
+        return self._complete_match_report(params, resp)
+
+    def _complete_match_report(
+        self, params: dict[str, Any], response: Any
+    ) -> MatchReport:
+        """
+        Merge the stats and report calls of a response into a MatchReport.
+
+        tool_choice="required" only guarantees at least one call, so a missing call
+        is requested again with tool_choice forced to that function.
+        """
+        arguments: dict[str, str] = {}
+        for tool_name in (STATS_TOOL_NAME, TOOL_NAME):
+            found = _find_tool_arguments(response, tool_name=tool_name)
+            if found is None:
+                logger.warning(
+                    "Response has no '{}' call; requesting it explicitly", tool_name
+                )
+                followup = self._call_openai(
+                    {
+                        **params,
+                        "tool_choice": {"type": "function", "name": tool_name},
+                        "parallel_tool_calls": False,
+                    }
+                )
+                found = _extract_required_tool_arguments(followup, tool_name=tool_name)
+            arguments[tool_name] = found
+
+        return _validate_match_report(arguments[STATS_TOOL_NAME], arguments[TOOL_NAME])
+
+    @retry(
+        stop=stop_after_attempt(OPENAI_MAX_ATTEMPTS),
+        wait=wait_exponential(
+            multiplier=1, min=OPENAI_RETRY_MIN_S, max=OPENAI_RETRY_MAX_S
+        ),
+        retry=retry_if_exception_type(_RETRYABLE_ERRORS),
+        before_sleep=_log_retry,
+        reraise=True,
+    )
+    def _call_openai(
+        self, params: dict[str, Any], on_delta: Callable[[str], None] | None = None
+    ) -> Any:
+        """
+        Call the Responses API (streamed when on_delta is given), retrying rate limits,
+        timeouts, connection errors and 5xx responses with exponential backoff.
+        """
+        if on_delta is None:
+            return self._single_attempt_client.responses.create(**params)  # type: ignore
+        return self._create_streamed(params, on_delta)
+
+    def _create_streamed(
+        self, params: dict[str, Any], on_delta: Callable[[str], None]
+    ) -> Any:
+        """
+        Stream a Responses API call, reporting the accumulated arguments of all tool
+        calls (one per line) to on_delta, and return the final response object.
+        """
+        logger.debug("Streaming OpenAI response")
+        arguments: dict[int, str] = {}
+        stream = self._single_attempt_client.responses.create(  # type: ignore
+            **params, stream=True
+        )
+
+        for event in stream:
+            if event.type == "response.function_call_arguments.delta":
+                index = event.output_index
+                arguments[index] = arguments.get(index, "") + event.delta
+                on_delta("\n".join(arguments[i] for i in sorted(arguments)))
+            elif event.type == "response.completed":
+                return event.response
+            elif event.type in ("response.failed", "response.incomplete"):
+                logger.error(
+                    "OpenAI stream ended with status '{}'", event.response.status
+                )
+                raise RuntimeError(
+                    f"OpenAI response {event.response.status}: {event.response.error}"
+                )
+            elif event.type == "error":
+                logger.error("OpenAI stream error: {}", event.message)
+                raise RuntimeError(f"OpenAI stream error: {event.message}")
+
+        logger.error("OpenAI stream ended without a completed response")
+        raise RuntimeError("OpenAI stream ended without a completed response.")
+
+    def analyze_many(
+        self, cleaned_texts: list[str], language: str = "en"
+    ) -> list[MatchReport]:
+        """
+        Analyze several matches in a single Responses API request.
+
+        Texts are concatenated behind "--- MATCH N ---" markers and the model emits
+        one parallel tool call per match; results are returned in input order.
+        Trades one larger prompt for N round-trips, which helps when RPM-bound.
+        """
+        logger.info("Starting multi-match analysis of {} texts", len(cleaned_texts))
+
+        if not cleaned_texts:
+            logger.error("cleaned_texts is empty")
+            raise ValueError("cleaned_texts is empty.")
+
+        for idx, text in enumerate(cleaned_texts):
+            if not text.strip():
+                logger.error("cleaned_texts[{}] is empty", idx)
+                raise ValueError(f"cleaned_texts[{idx}] is empty.")
+
+        count = len(cleaned_texts)
+        combined_text = "\n\n".join(
+            f"--- MATCH {number} ---\n{text}"
+            for number, text in enumerate(cleaned_texts, start=1)
+        )
+        logger.debug("Combined input length: {} characters", len(combined_text))
+
+        params = self._request_params(combined_text, language)
+        params["instructions"] += "\n\n" + MULTI_MATCH_INSTRUCTION.format(count=count)
+        params["tools"] = _INDEXED_TOOLS
 
-        tools = [
-            {
-                "type": "function",
-                "name": TOOL_NAME,
-                "description": "Submit extracted match statistics and a 300-word match report.",
-                "parameters": tool_schema,
-            }
-        ]
         # --- OpenAI call ---
-        logger.info("Sending request to OpenAI (tool_choice=required)")
+        logger.info("Sending multi-match request to OpenAI (parallel tool calls)")
         try:
-            language_instruction = self._language_instruction(language)
-
-            resp = client.responses.create(  # type: ignore
-                model=self.model,
-                input=cleaned_text,
-                temperature=TEMPERATURE,
-                instructions=f"{SYSTEM_PROMPT}\n\n{language_instruction}",
-                tool_choice="required",
-                tools=tools,
-            )
-
+            resp = self._call_openai(params)
         except Exception:
             logger.exception("OpenAI API call failed")
             raise
 
         logger.success("OpenAI response received")
 
-        # --- Extract tool arguments ---
-        logger.debug("Extracting tool call arguments from OpenAI response")
-        arguments_json = _extract_required_tool_arguments(resp, tool_name=TOOL_NAME)
+        # --- Pair stats/report calls by match_index and validate ---
+        stats_calls = self._complete_indexed_calls(params, resp, STATS_TOOL_NAME, count)
+        report_calls = self._complete_indexed_calls(params, resp, TOOL_NAME, count)
+
+        results: list[MatchReport] = []
+        for number in range(1, count + 1):
+            try:
+                results.append(
+                    MatchReport.model_validate(
+                        {**stats_calls[number], **report_calls[number]}
+                    )
+                )
+            except Exception:
+                logger.exception("Schema validation failed for match {}", number)
+                raise
+
+        logger.success("AI output validated successfully")
+        return results
+
+    def _complete_indexed_calls(
+        self, params: dict[str, Any], response: Any, tool_name: str, count: int
+    ) -> dict[int, dict[str, Any]]:
+        """
+        Index the tool_name calls of a multi-match response by match_index, asking
+        once more (tool_choice forced to tool_name) for matches that got no call.
+        """
+        calls = _index_tool_calls(response, tool_name, count)
+        missing = [number for number in range(1, count + 1) if number not in calls]
+        if missing:
+            logger.warning(
+                "No '{}' call for matches {}; requesting them explicitly",
+                tool_name,
+                missing,
+            )
+            numbers = ", ".join(str(number) for number in missing)
+            followup = self._call_openai(
+                {
+                    **params,
+                    "instructions": params["instructions"]
+                    + "\n\n"
+                    + MISSING_CALLS_INSTRUCTION.format(
+                        tool_name=tool_name, numbers=numbers
+                    ),
+                    "tool_choice": {"type": "function", "name": tool_name},
+                }
+            )
+            extra = _index_tool_calls(followup, tool_name, count)
+            calls.update(
+                {number: extra[number] for number in missing if number in extra}
+            )
+
+        missing = [number for number in range(1, count + 1) if number not in calls]
+        if missing:
+            logger.error("No '{}' call returned for matches {}", tool_name, missing)
+            raise RuntimeError(f"No '{tool_name}' call returned for matches {missing}.")
+
+        return calls
+
+    def analyze_batch(
+        self, cleaned_texts: list[str], language: str = "en"
+    ) -> list[MatchReport]:
+        """
+        Analyze many cleaned page texts and return validated MatchReports in input order.
 
-        logger.debug(f"Tool arguments JSON length: {len(arguments_json)}")
+        With use_batch_api enabled, all requests are submitted as one OpenAI Batch API
+        job (half the price, no per-request round-trips) and this call blocks until the
+        batch finishes. Otherwise falls back to sequential analyze() calls.
+        """
+        logger.info("Starting batch analysis of {} texts", len(cleaned_texts))
+
+        if not cleaned_texts:
+            logger.error("cleaned_texts is empty")
+            raise ValueError("cleaned_texts is empty.")
+
+        if not self.use_batch_api:
+            logger.info("Batch API disabled, analyzing texts sequentially")
+            return [self.analyze(text, language=language) for text in cleaned_texts]
+
+        for idx, text in enumerate(cleaned_texts):
+            if not text.strip():
+                logger.error("cleaned_texts[{}] is empty", idx)
+                raise ValueError(f"cleaned_texts[{idx}] is empty.")
+
+        # --- Build JSONL input (one request per line) ---
+        bodies = [self._request_params(text, language) for text in cleaned_texts]
+        lines = [
+            json.dumps(
+                {
+                    "custom_id": str(idx),
+                    "method": "POST",
+                    "url": _BATCH_ENDPOINT,
+                    "body": body,
+                },
+                ensure_ascii=False,
+            )
+            for idx, body in enumerate(bodies)
+        ]
+        batch_input = ("\n".join(lines) + "\n").encode("utf-8")
+        logger.debug("Batch input size: {} bytes", len(batch_input))
 
-        # --- Validate schema ---
-        logger.info("Validating AI output with Pydantic schema")
+        # --- Submit batch ---
         try:
-            result = MatchReport.model_validate_json(arguments_json)
+            input_file = self._client.files.create(
+                file=("batch_input.jsonl", batch_input), purpose="batch"
+            )
+            batch = self._client.batches.create(
+                input_file_id=input_file.id,
+                endpoint=_BATCH_ENDPOINT,
+                completion_window=BATCH_COMPLETION_WINDOW,
+            )
         except Exception:
-            logger.exception("Schema validation failed")
+            logger.exception("OpenAI batch submission failed")
             raise
 
-        logger.success("AI output validated successfully")
-        return result
+        logger.info("Batch submitted: {}", batch.id)
 
+        batch = _wait_for_batch(self._client, batch.id)
+        if batch.status != "completed" or not batch.output_file_id:
+            logger.error("Batch {} finished with status '{}'", batch.id, batch.status)
+            raise RuntimeError(
+                f"OpenAI batch {batch.id} finished with status '{batch.status}' "
+                f"(error file: {batch.error_file_id})."
+            )
 
-def _extract_required_tool_arguments(response: Any, tool_name: str) -> str:
+        logger.success("Batch {} completed", batch.id)
+
+        # --- Parse output (lines are not guaranteed to be in input order) ---
+        output_text = self._client.files.content(batch.output_file_id).text
+        results: dict[int, MatchReport] = {}
+        for line in output_text.splitlines():
+            if not line.strip():
+                continue
+
+            record = json.loads(line)
+            custom_id = record.get("custom_id")
+            response = record.get("response") or {}
+
+            if record.get("error") or response.get("status_code") != 200:
+                logger.error("Batch request {} failed", custom_id)
+                raise RuntimeError(
+                    f"Batch request {custom_id} failed: "
+                    f"{record.get('error') or response.get('body')}"
+                )
+
+            idx = int(custom_id)
+            results[idx] = self._complete_match_report(
+                bodies[idx], Response.model_validate(response["body"])
+            )
+
+        missing = [idx for idx in range(len(cleaned_texts)) if idx not in results]
+        if missing:
+            logger.error("Batch output is missing results for requests {}", missing)
+            raise RuntimeError(
+                f"Batch output is missing results for requests {missing}."
+            )
+
+        return [results[idx] for idx in range(len(cleaned_texts))]
+
+
+@lru_cache(maxsize=1)
+def _build_instructions() -> Mapping[str, str]:
     """
-    Extract the arguments JSON string from a required tool call in a Responses API response.
+    Build the full instructions string for each supported report language once per process.
     """
-    logger.debug("Inspecting OpenAI response output items")
+    return MappingProxyType(
+        {
+            "en": f"{SYSTEM_PROMPT}\n\nGenerate the report in English language.",
+            "cs": f"{SYSTEM_PROMPT}\n\nGenerate the report in Czech language.",
+        }
+    )
 
-    output_items = getattr(response, "output", None)
-    if not output_items:
-        logger.error("OpenAI response has no output items")
-        raise RuntimeError("OpenAI response has no output items; expected a tool call.")
 
-    logger.debug(f"Number of output items: {len(output_items)}")
+def _wait_for_batch(client: OpenAI, batch_id: str) -> Any:
+    """
+    Poll a Batch API job with exponential backoff until it reaches a terminal status.
 
-    for idx, item in enumerate(output_items):
-        item_type = getattr(item, "type", None)
-        logger.debug(f"Output item {idx}: type={item_type}")
+    Transient errors (after the SDK's own retries) only skip a poll: the batch
+    keeps running on OpenAI's side, so giving up here would orphan it.
+    """
+    delay = BATCH_POLL_INITIAL_S
+    while True:
+        try:
+            batch = client.batches.retrieve(batch_id)
+        except _RETRYABLE_ERRORS as exc:
+            logger.warning("Polling batch {} failed: {!r}; will retry", batch_id, exc)
+        except Exception:
+            logger.exception(
+                "Polling batch {} failed; it may still be running", batch_id
+            )
+            raise
+        else:
+            logger.debug("Batch {} status: {}", batch_id, batch.status)
+            if batch.status in _BATCH_TERMINAL_STATUSES:
+                return batch
 
-        if item_type != "function_call":
-            continue
+        time.sleep(delay)
+        delay = min(delay * 2, BATCH_POLL_MAX_S)
 
-        name = getattr(item, "name", None)
-        logger.debug(f"Function call name: {name}")
 
-        if name != tool_name:
-            logger.debug("Function call name does not match required tool")
-            continue
+def _validate_match_report(stats_json: str, report_json: str) -> MatchReport:
+    """
+    Merge the stats and report tool-call arguments and validate them as one MatchReport.
+    """
+    logger.debug(
+        "Tool arguments JSON length: stats={}, report={}",
+        len(stats_json),
+        len(report_json),
+    )
+
+    # --- Validate schema ---
+    logger.info("Validating AI output with Pydantic schema")
+    try:
+        result = MatchReport.model_validate(
+            {**json.loads(stats_json), **json.loads(report_json)}
+        )
+    except Exception:
+        logger.exception("Schema validation failed")
+        raise
+
+    logger.success("AI output validated successfully")
+    return result
+
+
+def _index_tool_calls(
+    response: Any, tool_name: str, count: int
+) -> dict[int, dict[str, Any]]:
+    """
+    Parse all calls to tool_name and key their arguments by match_index (1..count).
 
-        arguments = getattr(item, "arguments", None)
-        if not arguments or not isinstance(arguments, str):
-            logger.error("Tool call found but arguments are missing or invalid")
+    Matches without a call are simply absent from the result.
+    """
+    calls: dict[int, dict[str, Any]] = {}
+    for arguments_json in _extract_tool_arguments(response, tool_name=tool_name):
+        data = json.loads(arguments_json)
+        number = data.pop(_MATCH_INDEX_FIELD, None)
+
+        if not isinstance(number, int) or number in calls or not 1 <= number <= count:
+            logger.error(
+                "Unexpected or duplicate match_index {} for '{}'", number, tool_name
+            )
             raise RuntimeError(
-                "Tool call found, but arguments are missing or not a string."
+                f"Unexpected or duplicate match_index {number} for '{tool_name}'."
             )
+        calls[number] = data
+
+    return calls
+
+
+def _find_tool_arguments(response: Any, tool_name: str) -> str | None:
+    """
+    Return the arguments JSON string of the first call to tool_name, or None.
+    """
+    output_items = _output_items(response)
+    call = next((item for item in output_items if _is_tool_call(item, tool_name)), None)
+    if call is None:
+        return None
+
+    logger.debug(
+        "Found tool call '{}' among {} output items", tool_name, len(output_items)
+    )
+    return _tool_call_arguments(call)
+
+
+def _extract_required_tool_arguments(response: Any, tool_name: str) -> str:
+    """
+    Extract the arguments JSON string from a required tool call in a Responses API response.
+    """
+    arguments = _find_tool_arguments(response, tool_name=tool_name)
+    if arguments is None:
+        logger.error("Required tool call '{}' not found in OpenAI response", tool_name)
+        raise RuntimeError(f"No required tool call found with name='{tool_name}'.")
+    return arguments
+
+
+def _extract_tool_arguments(response: Any, tool_name: str) -> list[str]:
+    """
+    Extract the arguments JSON strings of all calls to tool_name in a Responses API response.
+    """
+    output_items = _output_items(response)
+    calls = [item for item in output_items if _is_tool_call(item, tool_name)]
+    logger.debug(
+        "Found {} '{}' tool call(s) among {} output items",
+        len(calls),
+        tool_name,
+        len(output_items),
+    )
+    return [_tool_call_arguments(call) for call in calls]
+
+
+def _output_items(response: Any) -> list[Any]:
+    output_items = getattr(response, "output", None)
+    if not output_items:
+        logger.error("OpenAI response has no output items")
+        raise RuntimeError("OpenAI response has no output items; expected a tool call.")
+    return output_items
+
+
+def _is_tool_call(item: Any, tool_name: str) -> bool:
+    return (
+        getattr(item, "type", None) == "function_call"
+        and getattr(item, "name", None) == tool_name
+    )
 
-        logger.success("Required tool call extracted successfully")
-        return arguments
 
-    logger.error(f"Required tool call '{tool_name}' not found in OpenAI response")
-    raise RuntimeError(f"No required tool call found with name='{tool_name}'.")
+def _tool_call_arguments(call: Any) -> str:
+    arguments = getattr(call, "arguments", None)
+    if not arguments or not isinstance(arguments, str):
+        logger.error("Tool call found but arguments are missing or invalid")
+        raise RuntimeError(
+            "Tool call found, but arguments are missing or not a string."
+        )
+    return arguments
@@ -4,16 +4,27 @@ ScoreFlash — Streamlit app for generating a football match report from a Lives
 
 from __future__ import annotations
 
+import asyncio
 import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from threading import Lock
+from typing import Callable
 
 import streamlit as st
+from cachetools import TTLCache
 from dotenv import load_dotenv
 
 from agent import MatchReportAgent
 from cleaner import build_stats_url, clean_html_to_text, normalize_match_url
-from config.parameters import API_ENV_VAR
+from config.parameters import (
+    API_ENV_VAR,
+    MODEL,
+    REPORT_CACHE_TTL_S,
+    STATS_CONTENT_SELECTOR,
+)
 from schemas import MatchReport
-from scraper import fetch_html
+from scraper import Scraper
 from storage import save_match_report
 
 load_dotenv()
@@ -220,13 +231,122 @@ def render_header() -> None:
     )
 
 
+async def _fetch_pages(match_url: str, stats_url: str) -> list[str]:
+    """Fetch the match and stats pages concurrently, sharing one browser."""
+    async with Scraper() as scraper:
+        return await asyncio.gather(
+            scraper.fetch(match_url),
+            scraper.fetch(stats_url, content_selector=STATS_CONTENT_SELECTOR),
+        )
+
+
 @st.cache_resource
+def _create_agent(api_key: str, model: str) -> MatchReportAgent:
+    """Create and cache one OpenAI agent per (api_key, model) (resource-level cache)."""
+    return MatchReportAgent(api_key=api_key, model=model)
+
+
 def get_agent() -> MatchReportAgent:
-    """Create and cache the OpenAI agent (resource-level cache)."""
+    """Return the cached OpenAI agent for the configured API key and model."""
     api_key = os.environ.get(API_ENV_VAR)
     if not api_key:
         raise RuntimeError(f"Missing {API_ENV_VAR} environment variable.")
-    return MatchReportAgent(api_key=api_key)
+    return _create_agent(api_key, MODEL)
+
+
+ReportKey = tuple[str, str]
+GeneratedReport = tuple[MatchReport, Path]
+
+
+class InFlightReports:
+    """
+    Coalesce identical report requests across sessions.
+
+    Concurrent requests for the same (match URL, language) share one pipeline run,
+    and finished reports are reused for REPORT_CACHE_TTL_S seconds.
+    """
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._in_flight: dict[ReportKey, Future[GeneratedReport]] = {}
+        self._results: TTLCache[ReportKey, GeneratedReport] = TTLCache(
+            maxsize=128, ttl=REPORT_CACHE_TTL_S
+        )
+
+    def run(
+        self, key: ReportKey, pipeline: Callable[[], GeneratedReport]
+    ) -> GeneratedReport:
+        with self._lock:
+            cached = self._results.get(key)
+            if cached is not None:
+                return cached
+
+            future = self._in_flight.get(key)
+            is_leader = future is None
+            if future is None:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not is_leader:
+            with st.spinner("Waiting for the same report requested elsewhere..."):
+                return future.result()
+
+        try:
+            result = pipeline()
+        except Exception as exc:
+            future.set_exception(exc)
+            raise
+        except BaseException:
+            # e.g. Streamlit stopping/rerunning the leader's script; don't leak
+            # that control-flow exception into other sessions
+            future.set_exception(RuntimeError("Report generation was interrupted."))
+            raise
+        else:
+            future.set_result(result)
+            with self._lock:
+                self._results[key] = result
+            return result
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+
+@st.cache_resource
+def get_in_flight_reports() -> InFlightReports:
+    """Process-wide report coalescing registry (resource-level cache)."""
+    return InFlightReports()
+
+
+def generate_report(
+    agent: MatchReportAgent, url: str, language_code: str
+) -> GeneratedReport:
+    """Fetch, clean, analyze and save one match report."""
+    with st.spinner("Fetching pages..."):
+        match_url = normalize_match_url(url)
+        stats_url = build_stats_url(url)
+
+        match_html, stats_html = asyncio.run(_fetch_pages(match_url, stats_url))
+
+    with st.spinner("Cleaning HTML..."):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            match_text, stats_text = executor.map(
+                clean_html_to_text, [match_html, stats_html]
+            )
+        combined_text = (
+            f"SOURCE: MATCH PAGE\n{match_text}\n\nSOURCE: STATS PAGE\n{stats_text}"
+        )
+
+    with st.spinner("Generating report with AI..."):
+        preview = st.empty()
+        result = agent.analyze(
+            combined_text,
+            language=language_code,
+            on_delta=lambda partial: preview.code(partial, language="json"),
+        )
+        preview.empty()
+
+    saved_path = save_match_report(result, source_url=url)
+    return result, saved_path
 
 
 def render_report(result: MatchReport) -> None:
@@ -343,24 +463,10 @@ def main() -> None:
         return
 
     try:
-        with st.spinner("Fetching pages..."):
-            match_url = normalize_match_url(url)
-            stats_url = build_stats_url(url)
-
-            match_html = fetch_html(match_url)
-            stats_html = fetch_html(stats_url)
-
-        with st.spinner("Cleaning HTML..."):
-            match_text = clean_html_to_text(match_html)
-            stats_text = clean_html_to_text(stats_html)
-            combined_text = (
-                f"SOURCE: MATCH PAGE\n{match_text}\n\nSOURCE: STATS PAGE\n{stats_text}"
-            )
-
-        with st.spinner("Generating report with AI..."):
-            result = agent.analyze(combined_text, language=language_code)
-
-        saved_path = save_match_report(result, source_url=url)
+        key = (normalize_match_url(url), language_code)
+        result, saved_path = get_in_flight_reports().run(
+            key, lambda: generate_report(agent, url, language_code)
+        )
         st.caption(f"Saved: {saved_path}")
 
         render_report(result)
@@ -13,18 +13,32 @@ Constraints:
 
 from __future__ import annotations
 
-import re
-from typing import Final
+import hashlib
+from collections import OrderedDict
+from functools import lru_cache
+from threading import Lock
+from typing import Final, Iterator
 from urllib.parse import urlsplit, urlunsplit
 
 from loguru import logger
-from selectolax.parser import HTMLParser
+from selectolax.parser import HTMLParser, Node
 
 from config.parameters import MAX_CHARS, STATS_PATH
 
-_REMOVE_SELECTOR: Final[str] = "script,style,svg,img,nav,footer"
+_REMOVE_TAGS: Final[frozenset[str]] = frozenset(
+    {"script", "style", "svg", "img", "nav", "footer"}
+)
 
+# Raw text is cut to max_chars * this factor before whitespace normalization
+_PRECUT_FACTOR: Final[int] = 4
 
+# Cleaned-text memo keyed by (HTML digest, max_chars); only the short output is kept
+_CLEAN_CACHE_SIZE: Final[int] = 64
+_clean_cache: OrderedDict[tuple[str, int], str] = OrderedDict()
+_clean_cache_lock = Lock()
+
+
+@lru_cache(maxsize=256)
 def build_stats_url(url: str) -> str:
     """
     Insert /prehled/stats/celkem/ into the URL path before the query string,
@@ -52,10 +66,11 @@ def build_stats_url(url: str) -> str:
     stats_url = urlunsplit(
         (parts.scheme, parts.netloc, new_path, parts.query, parts.fragment)
     )
-    logger.debug(f"Built stats URL: {stats_url}")
+    logger.debug("Built stats URL: {}", stats_url)
     return stats_url
 
 
+@lru_cache(maxsize=256)
 def normalize_match_url(url: str) -> str:
     """
     Normalize match URL a bit (mainly path trailing slash handling),
@@ -70,15 +85,54 @@ def normalize_match_url(url: str) -> str:
     normalized = urlunsplit(
         (parts.scheme, parts.netloc, path, parts.query, parts.fragment)
     )
-    logger.debug(f"Normalized match URL: {normalized}")
+    logger.debug("Normalized match URL: {}", normalized)
     return normalized
 
 
+def _iter_visible_text(root: Node) -> Iterator[str]:
+    """
+    Yield text nodes under root in document order in a single traversal,
+    skipping whole subtrees rooted at _REMOVE_TAGS (no tree mutation).
+    """
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        tag = node.tag
+        if tag == "-text":
+            yield node.text_content
+        elif tag not in _REMOVE_TAGS:
+            stack.extend(reversed(list(node.iter(include_text=True))))
+
+
 def _normalize_whitespace(text: str) -> str:
     """
     Normalize whitespace to single spaces and trim.
     """
-    return re.sub(r"\s+", " ", text).strip()
+    return " ".join(text.split())
+
+
+def _bounded_visible_text(root: Node, max_chars: int) -> str:
+    """
+    Collect and normalize only as much visible text as is needed to fill
+    max_chars, without materializing the whole body text.
+
+    Traversal stops once max_chars * 4 raw characters are buffered. Whitespace
+    collapsing never lengthens text, so that usually suffices; if collapsing
+    shrinks it below max_chars, the cap is doubled and traversal resumes. The
+    first max_chars characters always match normalizing the full text.
+    """
+    parts: list[str] = []
+    size = 0
+    limit = max_chars * _PRECUT_FACTOR
+    for part in _iter_visible_text(root):
+        parts.append(part)
+        size += len(part) + 1
+        if size >= limit:
+            cleaned = _normalize_whitespace(" ".join(parts))
+            if len(cleaned) >= max_chars:
+                return cleaned
+            limit *= 2
+    return _normalize_whitespace(" ".join(parts))
 
 
 def clean_html_to_text(html: str, max_chars: int = MAX_CHARS) -> str:
@@ -99,23 +153,43 @@ def clean_html_to_text(html: str, max_chars: int = MAX_CHARS) -> str:
     Returns:
         Cleaned text (<= max_chars)
 
+    Results are memoized by a blake2b digest of the HTML, so re-cleaning an
+    identical page (repeated Generate clicks, retries) skips parsing.
+
     Raises:
         ValueError: If html is empty.
     """
     if not html or not html.strip():
         raise ValueError("HTML is empty.")
 
-    parser = HTMLParser(html)
-    logger.debug("Removing non-content elements...")
-    for node in parser.css(_REMOVE_SELECTOR):
-        node.decompose()
+    key = (hashlib.blake2b(html.encode(), digest_size=16).hexdigest(), max_chars)
+    with _clean_cache_lock:
+        cached = _clean_cache.get(key)
+        if cached is not None:
+            _clean_cache.move_to_end(key)
+            logger.debug("Cleaned text served from cache.")
+            return cached
+
+    cleaned = _clean_html_to_text_uncached(html, max_chars)
+
+    with _clean_cache_lock:
+        _clean_cache[key] = cleaned
+        if len(_clean_cache) > _CLEAN_CACHE_SIZE:
+            _clean_cache.popitem(last=False)
+
+    return cleaned
+
 
-    logger.debug("Extracting text from body...")
-    body = parser.body
-    text = body.text(separator=" ") if body else parser.text(separator=" ")
+def _clean_html_to_text_uncached(html: str, max_chars: int) -> str:
+    """
+    Parse HTML, drop non-content elements and return normalized, truncated text.
+    """
+    parser = HTMLParser(html)
 
+    logger.debug("Extracting text from body (skipping non-content elements)...")
+    root = parser.body or parser.root
     logger.debug("Normalizing whitespaces...")
-    cleaned = _normalize_whitespace(text)
+    cleaned = _bounded_visible_text(root, max_chars) if root else ""
     if len(cleaned) > max_chars:
         cleaned = cleaned[:max_chars]
 
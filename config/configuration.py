@@ -9,8 +9,9 @@ from loguru import logger
 
 load_dotenv()
 
-# Tool name used for function/tool calling
+# Tool names used for function/tool calling (narrative report + extracted statistics)
 TOOL_NAME: Final[str] = "submit_match_report"
+STATS_TOOL_NAME: Final[str] = "submit_match_stats"
 
 run_mode = os.getenv("MODE", "prod").lower()
 
@@ -1,32 +1,58 @@
 from __future__ import annotations
 
-from typing import List, Literal, Optional
+from enum import Enum
+from typing import Any, List, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
 
+class Team(str, Enum):
+    """Side of the match an event belongs to."""
+
+    HOME = "home"
+    AWAY = "away"
+
+
+class GoalKind(str, Enum):
+    """Type of goal event."""
+
+    GOAL = "goal"
+    PENALTY_GOAL = "penalty_goal"
+    OWN_GOAL = "own_goal"
+    DISALLOWED_GOAL = "disallowed_goal"
+
+
+class CardType(str, Enum):
+    """Card colour (second_yellow is the yellow that leads to a red)."""
+
+    YELLOW = "yellow"
+    RED = "red"
+    SECOND_YELLOW = "second_yellow"
+
+
+class KickOutcome(str, Enum):
+    """Outcome of a penalty shootout kick."""
+
+    SCORED = "scored"
+    MISSED = "missed"
+    SAVED = "saved"
+    POST = "post"
+    UNKNOWN = "unknown"
+
+
 class GoalEvent(BaseModel):
     """A single goal-like event in the timeline (including own goals, penalties, disallowed goals)."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     minute: Optional[str] = Field(
         None,
         description='Minute string as shown on the page, e.g. "12", "45+2", "90+5".',
     )
-    team: Optional[Literal["home", "away"]] = Field(
-        None, description="Which team the event belongs to."
-    )
+    team: Optional[Team] = Field(None, description="Which team the event belongs to.")
     scorer: Optional[str] = Field(None, description="Scorer name if available.")
     assist: Optional[str] = Field(None, description="Assist name if available.")
-    kind: Optional[
-        Literal[
-            "goal",
-            "penalty_goal",
-            "own_goal",
-            "disallowed_goal",
-        ]
-    ] = Field(None, description="Type of goal event.")
+    kind: Optional[GoalKind] = Field(None, description="Type of goal event.")
     counted: Optional[bool] = Field(
         None, description="Whether this goal counted in the official score."
     )
@@ -39,37 +65,31 @@ class GoalEvent(BaseModel):
 class CardEvent(BaseModel):
     """A single card event (yellow/red/second yellow) with time and team."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     minute: Optional[str] = Field(
         None,
         description='Minute string as shown on the page, e.g. "33", "90+1".',
     )
-    team: Optional[Literal["home", "away"]] = Field(
-        None, description="Which team the card belongs to."
-    )
+    team: Optional[Team] = Field(None, description="Which team the card belongs to.")
     player: Optional[str] = Field(None, description="Player name if available.")
-    card: Optional[Literal["yellow", "red", "second_yellow"]] = Field(
-        None, description="Card type."
-    )
+    card: Optional[CardType] = Field(None, description="Card type.")
     note: Optional[str] = Field(None, description='Reason if available, e.g. "foul".')
 
 
 class PenaltyShootoutKick(BaseModel):
     """One kick in a penalty shootout series."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True, populate_by_name=True)
 
     order: Optional[int] = Field(None, description="Kick order in the shootout (1..N).")
-    team: Optional[Literal["home", "away"]] = Field(
-        None, description="Which team took the kick."
-    )
+    team: Optional[Team] = Field(None, description="Which team took the kick.")
     taker: Optional[str] = Field(
         None,
         alias="player",
         description="Penalty taker name if available.",
     )
-    outcome: Optional[Literal["scored", "missed", "saved", "post", "unknown"]] = Field(
+    outcome: Optional[KickOutcome] = Field(
         None,
         alias="result",
         description="Outcome of the kick.",
@@ -83,7 +103,7 @@ class MatchReport(BaseModel):
     Extended to include timeline details: goals, cards, substitutions, penalties, etc.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = ConfigDict(extra="forbid", frozen=True)
 
     # --- Validity ---
     is_valid: bool = Field(
@@ -193,3 +213,33 @@ class MatchReport(BaseModel):
 
     # --- Final generated narrative ---
     report: str = Field(..., description="Professional ~300-word match report.")
+
+    @classmethod
+    def from_trusted(cls, data: dict[str, Any]) -> MatchReport:
+        """
+        Build a MatchReport from data already known to conform to the schema,
+        skipping validation of the top-level fields (model_construct).
+
+        Nested events are still validated: they are few and small, and
+        validation converts their string values into the Team/GoalKind/CardType/
+        KickOutcome enums that serialization expects.
+
+        Only for data this app produced itself, e.g. reports it serialized.
+        Untrusted input, including LLM tool-call arguments, must go through
+        model_validate.
+        """
+        return cls.model_construct(
+            **{
+                **data,
+                "goals": [GoalEvent.model_validate(g) for g in data.get("goals", [])],
+                "cards": [CardEvent.model_validate(c) for c in data.get("cards", [])],
+                "penalty_shootout_kicks": [
+                    PenaltyShootoutKick.model_validate(k)
+                    for k in data.get("penalty_shootout_kicks", [])
+                ],
+                "disallowed_goals": [
+                    GoalEvent.model_validate(g)
+                    for g in data.get("disallowed_goals", [])
+                ],
+            }
+        )
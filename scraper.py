@@ -1,57 +1,305 @@
 """
-Synchronous Playwright scraper for fetching fully-rendered HTML.
+Playwright scraper for fetching fully-rendered HTML.
 
 Requirements:
-- playwright.sync_api
-- headless Chromium
-- slight scroll using page.mouse.wheel()
-- brief wait for content load
-- return raw HTML
-- no async / no asyncio
+- playwright.async_api (sync callers use the fetch_html wrapper)
+- headless Chromium, one browser/context per Scraper, new page per fetch
+- optional proxy (PLAYWRIGHT_PROXY)
+- wait for the content selector; slight scroll using page.mouse.wheel() as fallback
+- images, media, fonts, stylesheets and analytics are blocked
+- return raw HTML (cached in memory and zstd-compressed on disk)
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
+import os
+import sys
+import time
+from collections import OrderedDict
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from threading import Lock
+from typing import Final
+from urllib.parse import unquote, urlsplit
+
+import zstandard
 from loguru import logger
-from playwright.sync_api import Browser, Page, sync_playwright
+from playwright.async_api import (
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    ProxySettings,
+    Route,
+    async_playwright,
+)
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
-from config.parameters import DEFAULT_TIMEOUT_MS
+from config.parameters import (
+    CONTENT_SELECTOR,
+    CONTENT_WAIT_TIMEOUT_MS,
+    DEFAULT_TIMEOUT_MS,
+    FETCH_CACHE_MAX_BYTES,
+    FETCH_CACHE_TTL_S,
+    FETCH_CONCURRENCY,
+    FETCH_DISK_CACHE_DIR,
+    FETCH_DISK_CACHE_TTL_S,
+    PROXY_ENV_VAR,
+    SETTLE_TIMEOUT_MS,
+    USER_AGENT,
+    VIEWPORT_HEIGHT,
+    VIEWPORT_WIDTH,
+)
 
 
-def fetch_html(url: str, timeout_ms: int = DEFAULT_TIMEOUT_MS) -> str:
+class _HtmlMemo:
     """
-    Fetch fully-rendered HTML from the given URL using synchronous Playwright.
+    In-process LRU of fetched HTML keyed by (url, UTC date), capped by total size.
 
-    Args:
-        url: Target URL.
-        timeout_ms: Navigation timeout.
+    HTML strings are large, so eviction is by bytes rather than entry count.
+    Entries expire ttl_s seconds after they were stored, and keying on the date
+    makes the next day's calls re-fetch naturally.
+    """
 
-    Returns:
-        Raw HTML content (page.content()).
+    def __init__(self, max_bytes: int, ttl_s: float) -> None:
+        self._max_bytes = max_bytes
+        self._ttl_s = ttl_s
+        # key -> (html, time.monotonic() when stored)
+        self._entries: OrderedDict[tuple[str, str], tuple[str, float]] = OrderedDict()
+        self._bytes = 0
+        self._lock = Lock()
 
-    Raises:
-        RuntimeError: If HTML could not be fetched.
+    def get(self, url: str) -> str | None:
+        key = _memo_key(url)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            html, stored_at = entry
+            if time.monotonic() - stored_at > self._ttl_s:
+                del self._entries[key]
+                self._bytes -= sys.getsizeof(html)
+                return None
+            self._entries.move_to_end(key)
+            return html
+
+    def put(self, url: str, html: str) -> None:
+        size = sys.getsizeof(html)
+        if size > self._max_bytes:
+            return
+        key = _memo_key(url)
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= sys.getsizeof(previous[0])
+            self._entries[key] = (html, time.monotonic())
+            self._bytes += size
+            while self._bytes > self._max_bytes:
+                _, (evicted, _) = self._entries.popitem(last=False)
+                self._bytes -= sys.getsizeof(evicted)
+
+
+def _memo_key(url: str) -> tuple[str, str]:
+    return url, time.strftime("%Y-%m-%d", time.gmtime())
+
+
+# Repeated fetches of a URL within FETCH_CACHE_TTL_S (and the same day) are served from memory
+_html_memo = _HtmlMemo(FETCH_CACHE_MAX_BYTES, FETCH_CACHE_TTL_S)
+
+# Runs before page scripts: hide the automation flag some sites check
+_INIT_SCRIPT: Final[str] = (
+    "Object.defineProperty(navigator, 'webdriver', {get: () => undefined});"
+)
+
+# Proxy schemes Chromium accepts
+_PROXY_SCHEMES: Final[frozenset[str]] = frozenset({"http", "https", "socks4", "socks5"})
+
+# Only the DOM is scraped, so these downloads are pure overhead
+_BLOCKED_RESOURCE_TYPES: Final[frozenset[str]] = frozenset(
+    {"image", "media", "font", "stylesheet"}
+)
+_BLOCKED_HOST_SUFFIXES: Final[tuple[str, ...]] = (
+    "google-analytics.com",
+    "googletagmanager.com",
+    "doubleclick.net",
+    "googlesyndication.com",
+    "facebook.net",
+    "hotjar.com",
+)
+
+
+class Scraper:
     """
-    if not url.strip():
-        raise ValueError("URL is empty.")
+    Async context manager that keeps one headless Chromium browser and context
+    alive and opens a fresh page per fetch.
 
-    try:
-        with sync_playwright() as p:
-            browser: Browser = p.chromium.launch(headless=False)
-            logger.info("Browser initialized.")
-            page: Page = browser.new_page()
+    Chromium starts lazily on the first cache miss, so batches served entirely
+    from cache never launch a browser. Pages of one scraper can be fetched
+    concurrently with asyncio.gather().
+
+    Args:
+        proxy: Proxy URL for Chromium; defaults to the PROXY_ENV_VAR environment
+            variable (read when the scraper is created), no proxy if unset.
+        settle_ms: Cap on the network settle after the fallback scroll.
+
+    Usage:
+        async with Scraper() as scraper:
+            html = await scraper.fetch(url)
+    """
+
+    def __init__(
+        self, proxy: str | None = None, settle_ms: int = SETTLE_TIMEOUT_MS
+    ) -> None:
+        self._proxy = _parse_proxy(proxy or os.getenv(PROXY_ENV_VAR))
+        self._settle_ms = settle_ms
+        self._playwright: Playwright | None = None
+        self._browser: Browser | None = None
+        self._context: BrowserContext | None = None
+        self._start_lock = asyncio.Lock()
+
+    async def __aenter__(self) -> Scraper:
+        return self
 
-            page.set_default_timeout(timeout_ms)
-            page.goto(url, wait_until="networkidle")
-            logger.success("Page loaded successfully!")
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
 
-            # Small scroll to trigger lazy-loaded content
-            page.mouse.wheel(0, 800)
-            page.wait_for_timeout(800)
-            logger.debug("Page scrolled down.")
+    async def close(self) -> None:
+        """
+        Close the context, browser and Playwright driver if they were started.
+        """
+        if self._context is not None:
+            await self._context.close()
+            self._context = None
+        if self._browser is not None:
+            await self._browser.close()
+            self._browser = None
+        if self._playwright is not None:
+            await self._playwright.stop()
+            self._playwright = None
 
-            html = page.content()
-            browser.close()
+    async def fetch(
+        self,
+        url: str,
+        timeout_ms: int = DEFAULT_TIMEOUT_MS,
+        content_selector: str = CONTENT_SELECTOR,
+        force_refresh: bool = False,
+    ) -> str:
+        """
+        Fetch fully-rendered HTML from the given URL.
+
+        Returns as soon as content_selector is attached to the DOM; if it does not
+        appear within CONTENT_WAIT_TIMEOUT_MS, falls back to a scroll and a short
+        network settle. Results are cached in memory per URL and UTC day for
+        FETCH_CACHE_TTL_S seconds (up to FETCH_CACHE_MAX_BYTES in total) and on disk
+        for FETCH_DISK_CACHE_TTL_S seconds.
+
+        Args:
+            url: Target URL.
+            timeout_ms: Navigation timeout.
+            content_selector: CSS selector of the content the pipeline needs.
+            force_refresh: Skip both caches and re-scrape the page.
+
+        Returns:
+            Raw HTML content (page.content()).
+
+        Raises:
+            RuntimeError: If HTML could not be fetched.
+        """
+        if not url.strip():
+            raise ValueError("URL is empty.")
+
+        if not force_refresh:
+            cached = _html_memo.get(url)
+            if cached is not None:
+                logger.info("HTML served from cache.")
+                return cached
+
+            cached = _read_disk_cache(url)
+            if cached is not None:
+                logger.info("HTML served from disk cache.")
+                _html_memo.put(url, cached)
+                return cached
+
+        html = await self._fetch_uncached(url, timeout_ms, content_selector)
+
+        _html_memo.put(url, html)
+        _write_disk_cache(url, html)
+        return html
+
+    async def fetch_many(
+        self,
+        urls: list[str],
+        concurrency: int = FETCH_CONCURRENCY,
+        content_selector: str = CONTENT_SELECTOR,
+    ) -> list[str]:
+        """
+        Fetch several URLs concurrently in this scraper's browser, at most
+        concurrency pages at a time. Results are returned in input order.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_one(url: str) -> str:
+            async with semaphore:
+                return await self.fetch(url, content_selector=content_selector)
+
+        return list(await asyncio.gather(*(fetch_one(url) for url in urls)))
+
+    async def _ensure_context(self) -> BrowserContext:
+        async with self._start_lock:
+            if self._context is None:
+                self._playwright = await async_playwright().start()
+                self._browser = await self._playwright.chromium.launch(
+                    headless=True, proxy=self._proxy
+                )
+                self._context = await self._browser.new_context(
+                    user_agent=USER_AGENT,
+                    viewport={"width": VIEWPORT_WIDTH, "height": VIEWPORT_HEIGHT},
+                )
+                # Registered once for every page of this context
+                await self._context.add_init_script(_INIT_SCRIPT)
+                await self._context.route("**/*", _block_heavy_requests)
+                logger.info("Browser initialized.")
+            return self._context
+
+    async def _fetch_uncached(
+        self, url: str, timeout_ms: int, content_selector: str
+    ) -> str:
+        try:
+            context = await self._ensure_context()
+            page: Page = await context.new_page()
+            try:
+                page.set_default_timeout(timeout_ms)
+                await page.goto(url, wait_until="domcontentloaded")
+                logger.success("Page loaded successfully!")
+
+                try:
+                    await page.wait_for_selector(
+                        content_selector,
+                        state="attached",
+                        timeout=CONTENT_WAIT_TIMEOUT_MS,
+                    )
+                except PlaywrightTimeoutError:
+                    logger.warning(
+                        "Content selector {!r} not found; scrolling instead.",
+                        content_selector,
+                    )
+                    # Small scroll to trigger lazy-loaded content
+                    await page.mouse.wheel(0, 800)
+                    try:
+                        await page.wait_for_load_state(
+                            "networkidle", timeout=self._settle_ms
+                        )
+                    except PlaywrightTimeoutError:
+                        pass
+                    logger.debug("Page scrolled down.")
+
+                html = await page.content()
+            finally:
+                await page.close()
 
             if not html or len(html) < 100:
                 logger.error("Fetched HTML is empty or unexpectedly short.")
@@ -60,5 +308,192 @@ def fetch_html(url: str, timeout_ms: int = DEFAULT_TIMEOUT_MS) -> str:
                 logger.info("HTML content loaded successfully.")
 
             return html
-    except Exception as exc:
-        raise RuntimeError(f"Failed to fetch HTML via Playwright: {exc}") from exc
+        except Exception as exc:
+            raise RuntimeError(f"Failed to fetch HTML via Playwright: {exc}") from exc
+
+
+@lru_cache(maxsize=8)
+def _parse_proxy(proxy: str | None) -> ProxySettings | None:
+    """
+    Convert a proxy URL (scheme://[user:pass@]host:port) into Playwright settings.
+
+    Parsed once per distinct value; the returned dict is shared, do not mutate it.
+
+    Raises:
+        ValueError: If the URL has an unsupported scheme, no host or a bad port.
+    """
+    if not proxy:
+        return None
+    parts = urlsplit(proxy)
+    try:
+        parts.port  # raises ValueError for a malformed port
+    except ValueError:
+        valid_port = False
+    else:
+        valid_port = True
+    if parts.scheme not in _PROXY_SCHEMES or not parts.hostname or not valid_port:
+        raise ValueError(
+            f"Invalid {PROXY_ENV_VAR} value {proxy!r}; "
+            "expected scheme://[user:pass@]host:port with scheme "
+            f"{', '.join(sorted(_PROXY_SCHEMES))}."
+        )
+    # Host and port as written (keeps the brackets of IPv6 literals), minus credentials
+    host_port = parts.netloc.rpartition("@")[2]
+    settings: ProxySettings = {"server": f"{parts.scheme}://{host_port}"}
+    if parts.username:
+        settings["username"] = unquote(parts.username)
+    if parts.password:
+        settings["password"] = unquote(parts.password)
+    return settings
+
+
+def _disk_cache_paths(url: str) -> tuple[Path, Path]:
+    """
+    Return the compressed HTML path and its metadata sidecar for a URL.
+    """
+    key = hashlib.blake2b(url.encode(), digest_size=16).hexdigest()
+    return (
+        FETCH_DISK_CACHE_DIR / f"{key}.html.zst",
+        FETCH_DISK_CACHE_DIR / f"{key}.json",
+    )
+
+
+def _read_disk_cache(url: str) -> str | None:
+    """
+    Return cached HTML for url if present and younger than FETCH_DISK_CACHE_TTL_S.
+    """
+    html_path, meta_path = _disk_cache_paths(url)
+    try:
+        if time.time() - html_path.stat().st_mtime > FETCH_DISK_CACHE_TTL_S:
+            _remove_disk_cache_entry(html_path, meta_path)
+            return None
+        return zstandard.decompress(html_path.read_bytes()).decode("utf-8")
+    except (OSError, zstandard.ZstdError, UnicodeDecodeError):
+        return None
+
+
+def _write_disk_cache(url: str, html: str) -> None:
+    """
+    Store compressed HTML plus a small JSON sidecar (URL, fetch time, size).
+
+    Failures are logged and ignored; the cache is an optimization only.
+    """
+    html_path, meta_path = _disk_cache_paths(url)
+    metadata = {
+        "url": url,
+        "fetched_at_utc": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "html_chars": len(html),
+    }
+    try:
+        FETCH_DISK_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _prune_disk_cache()
+        html_path.write_bytes(zstandard.compress(html.encode("utf-8")))
+        meta_path.write_text(json.dumps(metadata, indent=2), encoding="utf-8")
+    except OSError:
+        logger.warning("Failed to write HTML disk cache for {}", url)
+
+
+def _remove_disk_cache_entry(html_path: Path, meta_path: Path) -> None:
+    """
+    Delete a cached HTML file and its sidecar, ignoring files already gone.
+    """
+    html_path.unlink(missing_ok=True)
+    meta_path.unlink(missing_ok=True)
+
+
+def _prune_disk_cache() -> None:
+    """
+    Delete disk cache entries older than FETCH_DISK_CACHE_TTL_S.
+
+    Expired entries are otherwise only removed when their URL is read again,
+    so pages that are never re-fetched would accumulate forever.
+    """
+    cutoff = time.time() - FETCH_DISK_CACHE_TTL_S
+    for html_path in FETCH_DISK_CACHE_DIR.glob("*.html.zst"):
+        try:
+            if html_path.stat().st_mtime < cutoff:
+                meta_path = html_path.with_name(
+                    html_path.name.removesuffix(".html.zst") + ".json"
+                )
+                _remove_disk_cache_entry(html_path, meta_path)
+        except OSError:
+            continue
+
+
+async def _block_heavy_requests(route: Route) -> None:
+    """
+    Abort image/media/font/stylesheet downloads and known analytics hosts.
+    """
+    request = route.request
+    host = urlsplit(request.url).hostname or ""
+    if request.resource_type in _BLOCKED_RESOURCE_TYPES or host.endswith(
+        _BLOCKED_HOST_SUFFIXES
+    ):
+        await route.abort()
+    else:
+        await route.continue_()
+
+
+async def fetch_html_async(
+    url: str,
+    timeout_ms: int = DEFAULT_TIMEOUT_MS,
+    content_selector: str = CONTENT_SELECTOR,
+    force_refresh: bool = False,
+    proxy: str | None = None,
+    settle_ms: int = SETTLE_TIMEOUT_MS,
+) -> str:
+    """
+    Fetch a single page with a short-lived Scraper.
+
+    Use Scraper directly to share one browser across several fetches.
+    """
+    async with Scraper(proxy=proxy, settle_ms=settle_ms) as scraper:
+        return await scraper.fetch(
+            url,
+            timeout_ms=timeout_ms,
+            content_selector=content_selector,
+            force_refresh=force_refresh,
+        )
+
+
+def fetch_html(
+    url: str,
+    timeout_ms: int = DEFAULT_TIMEOUT_MS,
+    content_selector: str = CONTENT_SELECTOR,
+    force_refresh: bool = False,
+    proxy: str | None = None,
+    settle_ms: int = SETTLE_TIMEOUT_MS,
+) -> str:
+    """
+    Synchronous wrapper around fetch_html_async() for callers without an event loop.
+    """
+    return asyncio.run(
+        fetch_html_async(
+            url,
+            timeout_ms=timeout_ms,
+            content_selector=content_selector,
+            force_refresh=force_refresh,
+            proxy=proxy,
+            settle_ms=settle_ms,
+        )
+    )
+
+
+def fetch_many(
+    urls: list[str],
+    concurrency: int = FETCH_CONCURRENCY,
+    content_selector: str = CONTENT_SELECTOR,
+    proxy: str | None = None,
+    settle_ms: int = SETTLE_TIMEOUT_MS,
+) -> list[str]:
+    """
+    Fetch several URLs concurrently with one shared browser (synchronous wrapper).
+    """
+
+    async def run() -> list[str]:
+        async with Scraper(proxy=proxy, settle_ms=settle_ms) as scraper:
+            return await scraper.fetch_many(
+                urls, concurrency=concurrency, content_selector=content_selector
+            )
+
+    return asyncio.run(run())
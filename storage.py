@@ -1,44 +1,238 @@
 from __future__ import annotations
 
 import json
-from datetime import datetime
+import os
+import time
+from functools import lru_cache
 from pathlib import Path
 
+import zstandard
 from loguru import logger
+from pydantic import BaseModel
 
-from config.parameters import BASE_OUTPUT_DIR
+from config.parameters import (
+    BASE_OUTPUT_DIR,
+    REPORT_ZSTD_DICT_DIR,
+    REPORT_ZSTD_DICT_SIZE,
+    REPORT_ZSTD_LEVEL,
+)
 from schemas import MatchReport
 
 BASE_DIR = BASE_OUTPUT_DIR
 BASE_DIR.mkdir(exist_ok=True, parents=True)
 
+# Whitespace and characters that are invalid in file names on Windows or POSIX
+_SAFE_TABLE = str.maketrans({c: "_" for c in ' /\\:*?"<>|\t\r\n'})
+
+
+class _SavedReport(BaseModel):
+    """
+    On-disk envelope, serialized in one pass by pydantic-core.
+    """
+
+    source_url: str
+    saved_at_utc: str
+    data: MatchReport
+
 
 def save_match_report(result: MatchReport, source_url: str) -> Path:
     """
-    Save full MatchReport statistics to a JSON file.
+    Save full MatchReport statistics to a zstd-compressed JSON file (.json.zst).
 
-    One file per run, timestamped.
+    One file per run, timestamped. Compressed with the newest dictionary in
+    REPORT_ZSTD_DICT_DIR when one exists; read back with load_match_report().
     """
-    timestamp = datetime.utcnow().strftime("%Y%m%d_%H%M%S")
-    safe_home = (result.home_team or "unknown").replace(" ", "_")
-    safe_away = (result.away_team or "unknown").replace(" ", "_")
+    timestamp = _utc_timestamp()
+    safe_home = (result.home_team or "unknown").translate(_SAFE_TABLE)
+    safe_away = (result.away_team or "unknown").translate(_SAFE_TABLE)
 
-    filename = f"{timestamp}_{safe_home}_vs_{safe_away}.json"
+    filename = f"{timestamp}_{safe_home}_vs_{safe_away}.json.zst"
     path = BASE_DIR / filename
 
-    payload = {
-        "source_url": source_url,
-        "saved_at_utc": timestamp,
-        "data": result.model_dump(),
-    }
+    payload = _SavedReport(source_url=source_url, saved_at_utc=timestamp, data=result)
 
     try:
-        with path.open("w", encoding="utf-8") as f:
-            json.dump(payload, f, ensure_ascii=False, indent=2)
+        _write_atomic(path, _compressor().compress(payload.model_dump_json().encode()))
 
         logger.success(f"Match statistics saved to {path}")
         return path
 
-    except Exception:
+    except OSError:
         logger.exception("Failed to save match report to file")
         raise
+
+
+def save_match_reports_batch(
+    reports: list[tuple[MatchReport, str]], path: Path
+) -> Path:
+    """
+    Append many (MatchReport, source_url) pairs to one JSON Lines file.
+
+    One open/write/fsync for the whole batch instead of one file per report;
+    each line is the same envelope save_match_report writes. Read back with
+    load_match_reports_batch().
+    """
+    timestamp = _utc_timestamp()
+    lines = b"".join(
+        _SavedReport(source_url=source_url, saved_at_utc=timestamp, data=result)
+        .model_dump_json()
+        .encode()
+        + b"\n"
+        for result, source_url in reports
+    )
+
+    try:
+        with path.open("ab") as f:
+            f.write(lines)
+            f.flush()
+            os.fsync(f.fileno())
+
+        logger.success("Saved {} match reports to {}", len(reports), path)
+        return path
+
+    except OSError:
+        logger.exception("Failed to save match report batch to file")
+        raise
+
+
+def load_match_reports_batch(path: Path) -> list[MatchReport]:
+    """
+    Load every MatchReport from a JSON Lines file written by save_match_reports_batch.
+    """
+    with path.open("rb") as f:
+        return [
+            MatchReport.from_trusted(json.loads(line)["data"])
+            for line in f
+            if line.strip()
+        ]
+
+
+def load_match_report(path: Path) -> MatchReport:
+    """
+    Load a MatchReport saved by save_match_report (.json.zst or legacy .json).
+
+    Files written by this app are trusted, so validation is skipped.
+    """
+    raw = path.read_bytes()
+    if path.suffix == ".zst":
+        raw = _decompress(raw)
+    return MatchReport.from_trusted(json.loads(raw)["data"])
+
+
+def train_report_dictionary(
+    paths: list[Path] | None = None, size: int = REPORT_ZSTD_DICT_SIZE
+) -> Path:
+    """
+    Train a zstd dictionary on saved reports and store it in REPORT_ZSTD_DICT_DIR.
+
+    Defaults to every report in BASE_DIR; zstd needs a reasonable number of
+    samples (dozens at least). The dictionary is saved under its own ID and
+    becomes the one used for new reports; earlier dictionaries stay on disk so
+    reports compressed with them remain readable.
+    """
+    if paths is None:
+        paths = sorted(
+            p for p in BASE_DIR.iterdir() if p.name.endswith((".json", ".json.zst"))
+        )
+    samples = []
+    for sample_path in paths:
+        raw = sample_path.read_bytes()
+        if sample_path.suffix == ".zst":
+            raw = _decompress(raw)
+        samples.append(raw)
+
+    dictionary = zstandard.train_dictionary(size, samples)
+    path = _dictionary_path(dictionary.dict_id())
+    REPORT_ZSTD_DICT_DIR.mkdir(parents=True, exist_ok=True)
+    _write_atomic(path, dictionary.as_bytes())
+    _load_dictionary.cache_clear()
+    _current_dictionary.cache_clear()
+
+    logger.success(
+        "Trained {}-byte zstd dictionary on {} reports",
+        len(dictionary.as_bytes()),
+        len(samples),
+    )
+    return path
+
+
+def _utc_timestamp() -> str:
+    """
+    Current UTC time as YYYYMMDD_HHMMSS (used in filenames and saved_at_utc).
+    """
+    t = time.gmtime()
+    return (
+        f"{t.tm_year:04d}{t.tm_mon:02d}{t.tm_mday:02d}_"
+        f"{t.tm_hour:02d}{t.tm_min:02d}{t.tm_sec:02d}"
+    )
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    """
+    Write data to a sibling temp file and rename it over path, so readers never
+    see a partially written report (os.replace is atomic on POSIX and Windows).
+    """
+    tmp_path = path.with_name(path.name + ".tmp")
+    try:
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def _dictionary_path(dict_id: int) -> Path:
+    return REPORT_ZSTD_DICT_DIR / f"reports-{dict_id}.zdict"
+
+
+@lru_cache(maxsize=None)
+def _load_dictionary(dict_id: int) -> zstandard.ZstdCompressionDict | None:
+    """
+    Load the dictionary with the given ID once, or None if it is not on disk.
+    """
+    path = _dictionary_path(dict_id)
+    if not path.exists():
+        return None
+    return zstandard.ZstdCompressionDict(path.read_bytes())
+
+
+@lru_cache(maxsize=1)
+def _current_dictionary() -> zstandard.ZstdCompressionDict | None:
+    """
+    The most recently trained dictionary (newest file), or None if none exists.
+    """
+    if not REPORT_ZSTD_DICT_DIR.is_dir():
+        return None
+    paths = sorted(
+        REPORT_ZSTD_DICT_DIR.glob("reports-*.zdict"), key=lambda p: p.stat().st_mtime
+    )
+    if not paths:
+        return None
+    return zstandard.ZstdCompressionDict(paths[-1].read_bytes())
+
+
+def _compressor() -> zstandard.ZstdCompressor:
+    """
+    Build a compressor per call (ZstdCompressor is not safe to share across threads).
+    """
+    dictionary = _current_dictionary()
+    if dictionary is None:
+        return zstandard.ZstdCompressor(level=REPORT_ZSTD_LEVEL)
+    return zstandard.ZstdCompressor(level=REPORT_ZSTD_LEVEL, dict_data=dictionary)
+
+
+def _decompress(raw: bytes) -> bytes:
+    """
+    Decompress a saved report, loading the dictionary named by the frame's dict_id.
+    """
+    dict_id = zstandard.get_frame_parameters(raw).dict_id
+    if not dict_id:
+        return zstandard.ZstdDecompressor().decompress(raw)
+
+    dictionary = _load_dictionary(dict_id)
+    if dictionary is None:
+        raise ValueError(
+            f"Report was compressed with zstd dictionary {dict_id}, "
+            f"but {_dictionary_path(dict_id)} does not exist."
+        )
+    return zstandard.ZstdDecompressor(dict_data=dictionary).decompress(raw)
@@ -0,0 +1,140 @@
+import json
+from types import SimpleNamespace
+
+import httpx
+import openai
+import pytest
+
+import agent as agent_module
+from agent import MatchReportAgent
+from config.configuration import STATS_TOOL_NAME, TOOL_NAME
+
+STATS = {"is_valid": True, "home_team": "A", "away_team": "B", "final_score": "1-0"}
+REPORT = {"report": "text"}
+
+
+def call(name: str, arguments: dict) -> SimpleNamespace:
+    return SimpleNamespace(
+        type="function_call", name=name, arguments=json.dumps(arguments)
+    )
+
+
+class FakeResponses:
+    """Returns the queued responses in order and records the request params."""
+
+    def __init__(self, *outputs: list[SimpleNamespace]) -> None:
+        self.outputs = list(outputs)
+        self.requests: list[dict] = []
+
+    def create(self, **params):
+        self.requests.append(params)
+        return SimpleNamespace(output=self.outputs.pop(0))
+
+
+def make_agent(responses: FakeResponses) -> MatchReportAgent:
+    agent = MatchReportAgent(api_key="test-key")
+    client = SimpleNamespace(responses=responses)
+    object.__setattr__(agent, "_client", client)
+    object.__setattr__(agent, "_single_attempt_client", client)
+    return agent
+
+
+def server_error() -> openai.InternalServerError:
+    request = httpx.Request("POST", "https://api.openai.com/v1/responses")
+    return openai.InternalServerError(
+        "Bad gateway", response=httpx.Response(502, request=request), body=None
+    )
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    monkeypatch.setattr(MatchReportAgent._call_openai.retry, "sleep", lambda _: None)
+    monkeypatch.setattr(agent_module.time, "sleep", lambda _: None)
+
+
+def test_analyze_merges_parallel_calls():
+    responses = FakeResponses([call(STATS_TOOL_NAME, STATS), call(TOOL_NAME, REPORT)])
+
+    result = make_agent(responses).analyze("page text")
+
+    assert (result.final_score, result.report) == ("1-0", "text")
+    assert len(responses.requests) == 1
+
+
+@pytest.mark.parametrize(
+    "present, missing, arguments",
+    [(STATS_TOOL_NAME, TOOL_NAME, REPORT), (TOOL_NAME, STATS_TOOL_NAME, STATS)],
+)
+def test_analyze_requests_missing_call(present, missing, arguments):
+    first = {STATS_TOOL_NAME: STATS, TOOL_NAME: REPORT}[present]
+    responses = FakeResponses([call(present, first)], [call(missing, arguments)])
+
+    result = make_agent(responses).analyze("page text")
+
+    assert (result.final_score, result.report) == ("1-0", "text")
+    assert responses.requests[1]["tool_choice"] == {"type": "function", "name": missing}
+
+
+def test_analyze_many_requests_missing_matches():
+    responses = FakeResponses(
+        [
+            call(STATS_TOOL_NAME, {"match_index": 1, **STATS}),
+            call(STATS_TOOL_NAME, {"match_index": 2, **STATS, "home_team": "C"}),
+            call(TOOL_NAME, {"match_index": 1, **REPORT}),
+        ],
+        [call(TOOL_NAME, {"match_index": 2, "report": "second"})],
+    )
+
+    results = make_agent(responses).analyze_many(["first page", "second page"])
+
+    assert [(r.home_team, r.report) for r in results] == [
+        ("A", "text"),
+        ("C", "second"),
+    ]
+    assert responses.requests[1]["tool_choice"] == {
+        "type": "function",
+        "name": TOOL_NAME,
+    }
+
+
+def test_sdk_retries_only_disabled_for_tenacity_wrapped_calls():
+    agent = MatchReportAgent(api_key="test-key")
+
+    assert agent._client.max_retries > 0
+    assert agent._single_attempt_client.max_retries == 0
+
+
+def test_analyze_retries_server_errors(no_sleep):
+    class FlakyResponses(FakeResponses):
+        def create(self, **params):
+            if not self.requests:
+                self.requests.append(params)
+                raise server_error()
+            return super().create(**params)
+
+    responses = FlakyResponses([call(STATS_TOOL_NAME, STATS), call(TOOL_NAME, REPORT)])
+
+    result = make_agent(responses).analyze("page text")
+
+    assert result.report == "text"
+    assert len(responses.requests) == 2
+
+
+def test_batch_polling_survives_transient_errors(no_sleep):
+    replies = [
+        openai.APIConnectionError(request=httpx.Request("GET", "https://x")),
+        SimpleNamespace(status="in_progress"),
+        server_error(),
+        SimpleNamespace(status="completed"),
+    ]
+
+    def retrieve(batch_id):
+        reply = replies.pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    client = SimpleNamespace(batches=SimpleNamespace(retrieve=retrieve))
+
+    assert agent_module._wait_for_batch(client, "batch_1").status == "completed"
+    assert not replies
@@ -0,0 +1,109 @@
+import os
+import sys
+import time
+
+import pytest
+
+import scraper
+
+
+def test_memo_returns_fresh_entries(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(scraper.time, "monotonic", lambda: now[0])
+    memo = scraper._HtmlMemo(max_bytes=10_000, ttl_s=300)
+
+    memo.put("https://example.com/a", "<html>a</html>")
+    now[0] += 299
+
+    assert memo.get("https://example.com/a") == "<html>a</html>"
+
+
+def test_memo_expires_entries_after_ttl(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(scraper.time, "monotonic", lambda: now[0])
+    memo = scraper._HtmlMemo(max_bytes=10_000, ttl_s=300)
+
+    memo.put("https://example.com/a", "<html>a</html>")
+    now[0] += 301
+
+    assert memo.get("https://example.com/a") is None
+    assert memo._bytes == 0
+
+
+def test_memo_evicts_oldest_by_size():
+    html = "x" * 1000
+    memo = scraper._HtmlMemo(max_bytes=2 * sys.getsizeof(html), ttl_s=300)
+
+    for name in ("a", "b", "c"):
+        memo.put(name, html)
+
+    assert memo.get("a") is None
+    assert memo.get("b") == memo.get("c") == html
+
+
+@pytest.fixture
+def disk_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(scraper, "FETCH_DISK_CACHE_DIR", tmp_path)
+    return tmp_path
+
+
+def expire(url: str) -> None:
+    old = time.time() - scraper.FETCH_DISK_CACHE_TTL_S - 1
+    for path in scraper._disk_cache_paths(url):
+        os.utime(path, (old, old))
+
+
+def test_disk_cache_round_trip(disk_cache):
+    scraper._write_disk_cache("https://example.com/a", "<html>á</html>")
+
+    assert scraper._read_disk_cache("https://example.com/a") == "<html>á</html>"
+    assert len(list(disk_cache.iterdir())) == 2
+
+
+def test_disk_cache_deletes_expired_entry_on_read(disk_cache):
+    scraper._write_disk_cache("https://example.com/a", "<html>a</html>")
+    expire("https://example.com/a")
+
+    assert scraper._read_disk_cache("https://example.com/a") is None
+    assert not list(disk_cache.iterdir())
+
+
+def test_disk_cache_prunes_expired_entries_on_write(disk_cache):
+    scraper._write_disk_cache("https://example.com/old", "<html>old</html>")
+    expire("https://example.com/old")
+
+    scraper._write_disk_cache("https://example.com/new", "<html>new</html>")
+
+    assert sorted(disk_cache.iterdir()) == sorted(
+        scraper._disk_cache_paths("https://example.com/new")
+    )
+
+
+@pytest.mark.parametrize(
+    "proxy, expected",
+    [
+        (None, None),
+        ("", None),
+        ("http://proxy.local:3128", {"server": "http://proxy.local:3128"}),
+        ("socks5://10.0.0.1:1080", {"server": "socks5://10.0.0.1:1080"}),
+        ("http://[::1]:8080", {"server": "http://[::1]:8080"}),
+        (
+            "http://us%40er:p%3Ass@[2001:db8::2]:3128",
+            {
+                "server": "http://[2001:db8::2]:3128",
+                "username": "us@er",
+                "password": "p:ss",
+            },
+        ),
+    ],
+)
+def test_parse_proxy(proxy, expected):
+    assert scraper._parse_proxy(proxy) == expected
+
+
+@pytest.mark.parametrize(
+    "proxy", ["proxy.local:3128", "ftp://proxy.local", "http://", "http://h:port"]
+)
+def test_parse_proxy_rejects_invalid_values(proxy):
+    with pytest.raises(ValueError):
+        scraper._parse_proxy(proxy)
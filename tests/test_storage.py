@@ -0,0 +1,106 @@
+import pytest
+import zstandard
+
+import storage
+from schemas import CardType, GoalKind, KickOutcome, MatchReport, Team
+
+# Serialization warnings (e.g. plain str where an enum is expected) fail the test
+pytestmark = pytest.mark.filterwarnings("error")
+
+
+@pytest.fixture
+def report() -> MatchReport:
+    return MatchReport.model_validate(
+        {
+            "is_valid": True,
+            "home_team": "Slavia Praha",
+            "away_team": "Baník Ostrava",
+            "final_score": "2-1",
+            "goals": [
+                {"minute": "12", "team": "home", "scorer": "A", "kind": "goal"},
+                {"minute": "80", "team": "away", "kind": "penalty_goal"},
+            ],
+            "cards": [{"minute": "33", "team": "away", "card": "yellow"}],
+            "penalty_shootout_kicks": [
+                {"order": 1, "team": "home", "player": "B", "result": "saved"}
+            ],
+            "disallowed_goals": [{"team": "home", "kind": "disallowed_goal"}],
+            "report": "Zápas skončil 2:1.",
+        }
+    )
+
+
+@pytest.fixture(autouse=True)
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(storage, "BASE_DIR", tmp_path)
+    monkeypatch.setattr(storage, "REPORT_ZSTD_DICT_DIR", tmp_path / "zstd")
+    storage._load_dictionary.cache_clear()
+    storage._current_dictionary.cache_clear()
+    yield tmp_path
+    storage._load_dictionary.cache_clear()
+    storage._current_dictionary.cache_clear()
+
+
+def save_samples(report: MatchReport, prefix: str, count: int = 60) -> list:
+    saved = []
+    for i in range(count):
+        sample = report.model_copy(
+            update={"home_team": f"{prefix} {i}", "report": f"{prefix} report {i} " * 5}
+        )
+        path = storage.save_match_report(sample, source_url=f"https://example.com/{i}")
+        saved.append((path.rename(path.with_name(f"{prefix}{i}_{path.name}")), sample))
+    return saved
+
+
+def test_save_load_round_trip(report):
+    path = storage.save_match_report(report, source_url="https://example.com/m")
+
+    loaded = storage.load_match_report(path)
+
+    assert loaded == report
+    assert loaded.model_dump_json() == report.model_dump_json()
+    assert loaded.goals[0].team is Team.HOME
+    assert loaded.goals[1].kind is GoalKind.PENALTY_GOAL
+    assert loaded.cards[0].card is CardType.YELLOW
+    assert loaded.penalty_shootout_kicks[0].outcome is KickOutcome.SAVED
+
+
+def test_batch_round_trip(report, output_dir):
+    path = output_dir / "batch.jsonl"
+    storage.save_match_reports_batch([(report, "u1"), (report, "u2")], path)
+
+    loaded = storage.load_match_reports_batch(path)
+
+    assert loaded == [report, report]
+    assert [r.model_dump_json() for r in loaded] == [report.model_dump_json()] * 2
+
+
+def test_legacy_json_round_trip(report, output_dir):
+    path = output_dir / "legacy.json"
+    path.write_text(
+        '{"source_url": "u", "saved_at_utc": "x", "data": %s}'
+        % report.model_dump_json(indent=2),
+        encoding="utf-8",
+    )
+
+    loaded = storage.load_match_report(path)
+
+    assert loaded.model_dump_json() == report.model_dump_json()
+
+
+def test_reports_stay_readable_after_retraining(report):
+    first = save_samples(report, "a")
+    first_dictionary = storage.train_report_dictionary(size=2048)
+    with_first = save_samples(report, "b")
+    second_dictionary = storage.train_report_dictionary(size=1024)
+    with_second = save_samples(report, "c", count=1)
+
+    assert first_dictionary != second_dictionary
+    assert first_dictionary.exists() and second_dictionary.exists()
+    frame_dict_ids = {
+        zstandard.get_frame_parameters(path.read_bytes()).dict_id
+        for path, _ in with_first + with_second
+    }
+    assert len(frame_dict_ids) == 2 and 0 not in frame_dict_ids
+    for path, sample in first + with_first + with_second:
+        assert storage.load_match_report(path) == sample